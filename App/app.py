@@ -1,26 +1,53 @@
 """PolarPlot Controller - Main entry point."""
 
-import os
+import functools
+import logging
 import sys
+from pathlib import Path
 
-from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QApplication
+_ICON_PATH = Path(__file__).resolve().parent / "assets" / "app_icon.icns"
 
-from ui.main_window import PlotterControlWindow
+# AIDEV-NOTE: PyQt6 and the ui package are imported lazily (inside main() or via
+# the module __getattr__ below) so importing this module stays cheap and the
+# interpreter doesn't pay PyQt6's load cost until the GUI is actually launched.
+
+
+def __getattr__(name: str):
+    """Lazily resolve heavy attributes on first access (PEP 562)."""
+    if name == "PlotterControlWindow":
+        from ui.main_window import PlotterControlWindow
+
+        return PlotterControlWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _app_icon():
+    """Return the application icon, decoding it only once per process."""
+    from PyQt6.QtGui import QIcon
+
+    return QIcon(str(_ICON_PATH))
 
 
 def main():
     """Launch the PolarPlot controller application."""
+    from PyQt6.QtWidgets import QApplication
+
+    from ui.main_window import PlotterControlWindow
+
     app = QApplication(sys.argv)
 
     app.setApplicationDisplayName("PolarPlot Controller")
     app.setApplicationName("PolarPlotController")
     app.setOrganizationName("Good in Theory Studios")
-    app.setWindowIcon(QIcon(os.path.join("assets", "app_icon.icns")))
+    app.setWindowIcon(_app_icon())
 
     window = PlotterControlWindow()
     window.show()
 
+    # Configured after show() so logging setup stays off the startup path
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
     sys.exit(app.exec())
 
 
@@ -4,12 +4,19 @@ This module handles loading and saving of machine configuration to/from JSON fil
 """
 
 import json
-from dataclasses import asdict
+import logging
+import os
+from dataclasses import asdict, fields, replace
 from pathlib import Path
 from typing import Optional, Tuple
 
 from models import MachineConfig, CONFIG_FILE
 
+log = logging.getLogger(__name__)
+
+# Field names accepted from the config file; unknown keys are ignored
+_FIELDS = frozenset(f.name for f in fields(MachineConfig))
+
 
 class ConfigManager:
     """Handles loading and saving of machine configuration."""
@@ -21,6 +28,8 @@ class ConfigManager:
             config_path: Path to configuration file (defaults to ~/.polarplot_config.json)
         """
         self.config_path = config_path
+        # Last loaded config keyed on the file's (st_mtime_ns, st_size)
+        self._cache: Optional[Tuple[Tuple[int, int], MachineConfig]] = None
 
     def load(self) -> MachineConfig:
         """Load configuration from file, returning defaults if not found.
@@ -31,22 +40,33 @@ class ConfigManager:
         config = MachineConfig()
 
         try:
-            if self.config_path.exists():
-                with open(self.config_path, "r") as f:
-                    data = json.load(f)
-                    # Update config with loaded values (fallback to defaults)
-                    config.width = data.get("width", config.width)
-                    config.height = data.get("height", config.height)
-                    config.safe_margin = data.get("safe_margin", config.safe_margin)
-                    config.led_enabled = data.get("led_enabled", config.led_enabled)
-                    config.led_brightness = data.get("led_brightness", config.led_brightness)
-                    config.steps_per_mm = data.get("steps_per_mm", config.steps_per_mm)
-                    config.microstepping = data.get("microstepping", config.microstepping)
-                    config.speed = data.get("speed", config.speed)
-                    config.acceleration = data.get("acceleration", config.acceleration)
-                print(f"✓ Loaded configuration from {self.config_path}")
-        except Exception as e:
-            print(f"Warning: Could not load config file: {e}")
+            st = self.config_path.stat()
+        except FileNotFoundError:
+            return config
+
+        # AIDEV-NOTE: Unchanged file (same mtime and size) -> skip read + parse.
+        # Hand out a copy so callers can't mutate the cached instance.
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cache is not None and self._cache[0] == key:
+            return replace(self._cache[1])
+
+        try:
+            data = json.loads(self.config_path.read_bytes())
+        except FileNotFoundError:
+            # Removed between stat() and read: same as never having saved one
+            return config
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+            log.warning("Could not load config file: %s", e)
+            return config
+
+        if not isinstance(data, dict):
+            log.warning("Could not load config file: expected a JSON object")
+            return config
+
+        # Update config with loaded values (fallback to defaults)
+        config = replace(config, **{k: v for k, v in data.items() if k in _FIELDS})
+        self._cache = (key, replace(config))
+        log.info("Loaded configuration from %s", self.config_path)
 
         return config
 
@@ -59,9 +79,21 @@ class ConfigManager:
         Returns:
             Tuple of (success: bool, error_message: Optional[str])
         """
+        # AIDEV-NOTE: Write to a sibling temp file and rename over the real one so
+        # a crash mid-write can never leave a truncated config behind.
+        tmp_path = self.config_path.with_suffix(self.config_path.suffix + ".tmp")
         try:
-            with open(self.config_path, "w") as f:
-                json.dump(asdict(config), f, indent=2)
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(asdict(config), separators=(",", ":")).encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
+            self._cache = None
             return True, None
-        except Exception as e:
+        except OSError as e:
+            # Don't leave a partial temp file next to the user's config
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
             return False, str(e)
@@ -5,6 +5,7 @@ to plotter paths. Uses modular components for quantization, rendering,
 and path extraction.
 """
 
+import logging
 from pathlib import Path
 
 from PIL import Image
@@ -26,6 +27,8 @@ from .utils import (
     scale_paths_to_machine,
 )
 
+log = logging.getLogger(__name__)
+
 
 class ImageProcessor:
     """Processes images into colored paths suitable for plotting."""
@@ -94,27 +97,23 @@ class ImageProcessor:
         Returns:
             ProcessedImage with all extracted paths and metadata
         """
-        print("Starting image processing pipeline...")
+        log.debug("Starting image processing pipeline")
 
-        print("Loading image...")
         # Load image
         image = self.load_image(file_path)
         orig_width, orig_height = image.size
-        print(f"Loaded image with size: {orig_width}x{orig_height} pixels.")
+        log.debug("Loaded image with size: %dx%d pixels", orig_width, orig_height)
 
-        print("Scaling image to fit machine...")
         # Scale down image to both fit machine and reduce processing load
         scaled_image, scale_factor, offset_x, offset_y = scale_image_to_machine(
             image, self.machine_config
         )
-        print(
-            f"Scaled image to {scaled_image.size[0]}x{scaled_image.size[1]} pixels for machine fit."
-        )
+        log.debug("Scaled image to %dx%d pixels for machine fit", *scaled_image.size)
 
         # Check rendering style
         style = self.processing_config.render_style
+        log.debug("Rendering %s style", style.value)
         if style == RenderStyle.STIPPLES:
-            print("Rendering stipple style...")
             paths = render_stipples(
                 scaled_image,
                 offset_x,
@@ -123,10 +122,8 @@ class ImageProcessor:
                 invert=self.processing_config.stipple_invert,
             )
         elif style == RenderStyle.HATCHING:
-            print("Rendering hatching style...")
             paths = render_hatching(scaled_image, offset_x, offset_y, self.processing_config)
         elif style == RenderStyle.CROSS_HATCH:
-            print("Rendering cross-hatch style...")
             paths = render_cross_hatch(scaled_image, offset_x, offset_y, self.processing_config)
         else:
             # just error for now
@@ -137,19 +134,21 @@ class ImageProcessor:
         result_path_preview_svg = colored_paths_to_svg(paths)
         with open(TEMP_SVG_PATH, "w") as f:
             f.write(result_path_preview_svg)
-            print(f"Saved intermediate SVG to {TEMP_SVG_PATH} for preview.")
+        log.debug("Saved intermediate SVG to %s for preview", TEMP_SVG_PATH)
 
         # If the style is stipple, the commands should be to move to the
         # center of each stipple and display it's color (brightness based on
         # the stipple size)
 
         # Return processed image data
-        print("Image processing complete.")
-        print(f"Total paths extracted: {len(paths)}")
         total_length = self.calculate_total_length(paths)
-        print(f"Total path length: {total_length:.2f} mm")
         command_count = self.count_commands(paths)
-        print(f"Total commands to be generated: {command_count}")
+        log.info(
+            "Image processing complete: %d paths, %.2f mm, %d commands",
+            len(paths),
+            total_length,
+            command_count,
+        )
 
         return ProcessedImage(
             paths=paths,
@@ -7,13 +7,14 @@ images to plotter paths: stipples (dots), hatching (parallel lines), etc.
 import math
 from typing import TYPE_CHECKING
 
+import numpy as np
 from PIL import Image
 
 from .utils import (
+    average_colors_in_circles,
     clip_line_to_rect,
-    get_average_color_circle,
     get_brightness,
-    get_color,
+    image_to_arrays,
 )
 
 if TYPE_CHECKING:
@@ -44,77 +45,89 @@ def render_stipples(
     from models import ColoredPath
 
     width, height = image.size
+    rgb, luminance = image_to_arrays(image)
 
     paths = []
     max_radius = processing_config.stipple_max_radius
     min_radius = processing_config.stipple_min_radius
     grid_size = max_radius * 2.5  # Grid spacing based on max dot size
-
-    # Precompute values for efficiency
     num_points = processing_config.stipple_points_per_circle
-    append_path = paths.append
-    int_x = int
-    int_y = int
-
-    y = grid_size / 2
-    while y < height:
-        x = grid_size / 2
-        while x < width:
-            brightness = get_brightness(image, int_x(x), int_y(y))
-            darkness = 1.0 - brightness
-
-            if invert:
-                darkness = 1.0 - darkness
-
-            # Skip very light areas
-            if darkness < 0.1:
-                x += grid_size
-                continue
 
-            # Calculate radius based on darkness
-            radius = min_radius + darkness * (max_radius - min_radius)
-
-            # Apply density factor - randomly skip some dots
-            if darkness < processing_config.stipple_density:
-                # Use position-based pseudo-random to be deterministic
-                if (int_x(x * 7 + y * 13) % 100) / 100.0 > darkness:
-                    x += grid_size
-                    continue
-
-            # Generate circle points using list comprehension
-            circle_points = [
-                (
-                    x + radius * math.cos(angle) + offset_x,
-                    y + radius * math.sin(angle) + offset_y,
-                )
-                for angle in (2 * math.pi * i / num_points for i in range(num_points + 1))
-            ]
-
-            # get the color of the stipple
-            average_color = get_average_color_circle(image, int_x(x), int_y(y), int(radius))
-
-            # If not inverted, invert all the colors
-            if not invert and len(average_color) == 3:
-                average_color = tuple(255 - c for c in average_color)
-
-            # Scale the color by darkness to make lighter dots for lighter areas
-            average_color = tuple(max(0, min(255, int(c * darkness))) for c in average_color)
-
-            if len(circle_points) >= 3 and len(average_color) == 3:
-                append_path(
-                    ColoredPath(
-                        points=circle_points,
-                        color=average_color,
-                        is_closed=True,
-                    )
+    # AIDEV-NOTE: Evaluate every grid cell at once - brightness lookup, light-area
+    # skip and the deterministic density test - then only loop over kept dots.
+    xs = _grid_positions(grid_size, width)
+    ys = _grid_positions(grid_size, height)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+
+    darkness = 1.0 - luminance[grid_y.astype(np.intp), grid_x.astype(np.intp)]
+    if invert:
+        darkness = 1.0 - darkness
+
+    # Skip very light areas
+    keep = darkness >= 0.1
+
+    # Apply density factor - use position-based pseudo-random to be deterministic
+    pseudo_random = (grid_x * 7 + grid_y * 13).astype(np.int64) % 100 / 100.0
+    keep &= (darkness >= processing_config.stipple_density) | (pseudo_random <= darkness)
+
+    # Calculate radius based on darkness
+    radii = min_radius + darkness * (max_radius - min_radius)
+
+    # Unit circle is the same for every dot; only scale and offset per dot
+    angles = [2 * math.pi * i / num_points for i in range(num_points + 1)]
+    unit_cos = np.array([math.cos(angle) for angle in angles])
+    unit_sin = np.array([math.sin(angle) for angle in angles])
+
+    rows, cols = np.nonzero(keep)  # Row-major, same order as a y-then-x sweep
+    dot_x = grid_x[rows, cols]
+    dot_y = grid_y[rows, cols]
+    dot_darkness = darkness[rows, cols]
+    dot_radius = radii[rows, cols]
+
+    # Outline points for every kept dot at once: shape (dots, points, 2)
+    circles = np.stack(
+        (
+            dot_x[:, None] + dot_radius[:, None] * unit_cos + offset_x,
+            dot_y[:, None] + dot_radius[:, None] * unit_sin + offset_y,
+        ),
+        axis=-1,
+    )
+
+    # Average color under every dot in one pass
+    colors = average_colors_in_circles(
+        rgb, dot_x.astype(np.int64), dot_y.astype(np.int64), dot_radius.astype(np.int64)
+    )
+
+    # If not inverted, invert all the colors
+    if not invert:
+        colors = 255 - colors
+
+    # Scale the color by darkness to make lighter dots for lighter areas
+    colors = np.clip((colors * dot_darkness[:, None]).astype(np.int64), 0, 255)
+
+    for circle_points, average_color in zip(circles, map(tuple, colors.tolist())):
+        if len(circle_points) >= 3:
+            paths.append(
+                ColoredPath(
+                    points=circle_points,
+                    color=average_color,
+                    is_closed=True,
                 )
-
-            x += grid_size
-        y += grid_size
+            )
 
     return paths
 
 
+def _grid_positions(step: float, limit: float) -> np.ndarray:
+    """Grid cell centers step/2, 3*step/2, ... below limit.
+
+    Built with a running sum so positions match repeated `pos += step`.
+    """
+    count = int(limit / step) + 2
+    positions = np.cumsum(np.concatenate(([step / 2], np.full(count - 1, step))))
+    return positions[positions < limit]
+
+
 def render_hatching(
     image: Image.Image,
     offset_x: float,
@@ -143,145 +156,22 @@ def render_hatching(
     Each segment's length varies by local brightness - darker = longer segments.
     Color is sampled from the image at each segment's midpoint.
     """
-    from models import ColoredPath
-
-    width, height = image.size
-
-    paths = []
-    angle_rad = math.radians(processing_config.hatching_angle)
-
-    # Calculate line direction and perpendicular
-    dx = math.cos(angle_rad)
-    dy = math.sin(angle_rad)
-    # Perpendicular direction for spacing
-    px = -dy
-    py = dx
-
-    # Calculate the range we need to cover with parallel lines
-    # Diagonal of the image gives max distance
-    diagonal = math.sqrt(width**2 + height**2)
-
-    # Start position offset (perpendicular to line direction)
-    current_offset = -diagonal / 2
-    max_offset = diagonal / 2
-
-    while current_offset < max_offset:
-        # Find line intersection with image bounds first
-        # Line passes through point: (width/2 + current_offset * px, height/2 + current_offset * py)
-        # Direction: (dx, dy)
-        center_x = width / 2 + current_offset * px
-        center_y = height / 2 + current_offset * py
-
-        # Find where line enters and exits the image rectangle
-        line_points = clip_line_to_rect(center_x, center_y, dx, dy, 0, 0, width, height)
-
-        if not line_points or len(line_points) != 2:
-            # Line doesn't intersect image, skip to next
-            current_offset += processing_config.hatching_line_spacing_light
-            continue
-
-        (x1, y1), (x2, y2) = line_points
-
-        # AIDEV-NOTE: Calculate total line length and direction vector for segmentation
-        line_length = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-        if line_length < 0.1:
-            current_offset += processing_config.hatching_line_spacing_light
-            continue
-
-        # Normalized direction vector for this line
-        dir_x = (x2 - x1) / line_length
-        dir_y = (y2 - y1) / line_length
-
-        # AIDEV-NOTE: Sample brightness at multiple points along the full line
-        # to determine average darkness for line spacing calculation
-        num_samples = 10
-        total_brightness = 0.0
-        for i in range(num_samples):
-            t = i / (num_samples - 1) if num_samples > 1 else 0.5
-            sample_x = int(x1 + t * (x2 - x1))
-            sample_y = int(y1 + t * (y2 - y1))
-            total_brightness += get_brightness(image, sample_x, sample_y)
-
-        avg_brightness = total_brightness / num_samples
-        avg_darkness = 1.0 - avg_brightness
-
-        # Apply invert: if invert is True, swap brightness/darkness logic
-        if invert:
-            avg_darkness = avg_brightness
-
-        # Skip very light areas (or very dark if inverted)
-        if avg_darkness < 0.05:
-            current_offset += processing_config.hatching_line_spacing_light
-            continue
-
-        # Calculate spacing to next parallel line based on average darkness
-        spacing = processing_config.hatching_line_spacing_light - avg_darkness * (
-            processing_config.hatching_line_spacing_light
-            - processing_config.hatching_line_spacing_dark
-        )
-
-        # AIDEV-NOTE: Break line into segments with varying lengths based on local brightness
-        # Darker areas get longer segments, lighter areas get shorter segments
-        current_distance = 0.0
-        segment_gap = processing_config.hatching_segment_gap
-
-        while current_distance < line_length:
-            # Calculate segment start position
-            seg_start_x = x1 + current_distance * dir_x
-            seg_start_y = y1 + current_distance * dir_y
-
-            # Sample brightness at segment start to determine segment length
-            sample_x = int(seg_start_x)
-            sample_y = int(seg_start_y)
-            brightness = get_brightness(image, sample_x, sample_y)
-            darkness = 1.0 - brightness
-
-            if invert:
-                darkness = brightness
-
-            # Skip very light segments
-            if darkness < 0.05:
-                current_distance += segment_gap
-                continue
-
-            # Calculate segment length based on darkness
-            # Darker = longer segments (up to max), lighter = shorter segments (down to min)
-            segment_length = processing_config.hatching_segment_min_length + darkness * (
-                processing_config.hatching_segment_max_length
-                - processing_config.hatching_segment_min_length
-            )
-
-            # Clamp segment to not exceed remaining line length
-            segment_length = min(segment_length, line_length - current_distance)
-
-            # Calculate segment end position
-            seg_end_x = seg_start_x + segment_length * dir_x
-            seg_end_y = seg_start_y + segment_length * dir_y
-
-            # Sample color at segment midpoint
-            mid_seg_x = int((seg_start_x + seg_end_x) / 2)
-            mid_seg_y = int((seg_start_y + seg_end_y) / 2)
-            segment_color = get_color(image, mid_seg_x, mid_seg_y)
-
-            # Convert to machine coordinates and add segment
-            machine_points = [
-                (seg_start_x + offset_x, seg_start_y + offset_y),
-                (seg_end_x + offset_x, seg_end_y + offset_y),
-            ]
-            paths.append(
-                ColoredPath(
-                    points=machine_points,
-                    color=segment_color,
-                    is_closed=False,
-                )
-            )
-
-            # Move to next segment position (segment length + gap)
-            current_distance += segment_length + segment_gap
-
-        current_offset += spacing
-
-    return paths
+    rgb, luminance = image_to_arrays(image)
+
+    return _render_hatch_layer(
+        rgb,
+        luminance,
+        offset_x,
+        offset_y,
+        angle=processing_config.hatching_angle,
+        line_spacing_dark=processing_config.hatching_line_spacing_dark,
+        line_spacing_light=processing_config.hatching_line_spacing_light,
+        segment_max_length=processing_config.hatching_segment_max_length,
+        segment_min_length=processing_config.hatching_segment_min_length,
+        segment_gap=processing_config.hatching_segment_gap,
+        darkness_threshold=0.05,  # Skip very light areas (or very dark if inverted)
+        invert=invert,
+    )
 
 
 def render_cross_hatch(
@@ -310,6 +200,7 @@ def render_cross_hatch(
     Layer 2: visible in 25%+ dark areas
     Layer 3: visible in 10%+ dark areas
     """
+    rgb, luminance = image_to_arrays(image)
 
     paths = []
     max_angles = processing_config.cross_hatch_max_angles
@@ -330,47 +221,66 @@ def render_cross_hatch(
         layer_threshold = 0.25 + (layer_idx * 0.25)
 
         # Render hatching for this angle with threshold filtering
-        layer_paths = _render_hatch_layer_with_threshold(
-            image,
+        layer_paths = _render_hatch_layer(
+            rgb,
+            luminance,
             offset_x,
             offset_y,
-            processing_config,
-            angle,
-            layer_threshold,
+            angle=angle,
+            line_spacing_dark=processing_config.cross_hatch_line_spacing_dark,
+            line_spacing_light=processing_config.cross_hatch_line_spacing_light,
+            segment_max_length=processing_config.cross_hatch_segment_max_length,
+            segment_min_length=processing_config.cross_hatch_segment_min_length,
+            segment_gap=processing_config.cross_hatch_segment_gap,
+            darkness_threshold=layer_threshold,
         )
         paths.extend(layer_paths)
 
     return paths
 
 
-def _render_hatch_layer_with_threshold(
-    image: Image.Image,
+def _render_hatch_layer(
+    rgb: np.ndarray,
+    luminance: np.ndarray,
     offset_x: float,
     offset_y: float,
-    processing_config: "ImageProcessingConfig",
     angle: float,
+    line_spacing_dark: float,
+    line_spacing_light: float,
+    segment_max_length: float,
+    segment_min_length: float,
+    segment_gap: float,
     darkness_threshold: float,
+    invert: bool = False,
 ) -> "list[ColoredPath]":
     """Helper: Render single hatch layer, skipping areas below darkness threshold.
 
-    This is the core hatching logic extracted for reuse by both render_hatching()
-    and render_cross_hatch(). It uses cross-hatch config parameters.
+    This is the core hatching logic shared by render_hatching() and
+    render_cross_hatch(); each passes its own spacing and segment parameters.
 
     Args:
-        image: RGB or grayscale PIL image
+        rgb: RGB array from image_to_arrays()
+        luminance: Luminance array from image_to_arrays()
         offset_x: X offset in mm
         offset_y: Y offset in mm
-        processing_config: Configuration object
         angle: Angle of hatching lines in degrees
-        darkness_threshold: Minimum darkness (0-1) to draw segments
+        line_spacing_dark: Spacing between lines in darkest areas (mm)
+        line_spacing_light: Spacing between lines in lightest areas (mm)
+        segment_max_length: Segment length in darkest areas (mm)
+        segment_min_length: Segment length in lightest areas (mm)
+        segment_gap: Gap between segments (mm)
+        darkness_threshold: Minimum darkness (0-1) to draw lines and segments
+        invert: If True, treat brightness as darkness (draw in light areas)
 
     Returns:
         List of ColoredPath objects for this layer
     """
     from models import ColoredPath
 
-    width, height = image.size
-    paths = []
+    height, width = luminance.shape
+    # Raw (start_x, start_y, end_x, end_y) image coordinates of each segment,
+    # colored and converted to ColoredPaths once the walk is done
+    segments: list[tuple[float, float, float, float]] = []
     angle_rad = math.radians(angle)
 
     # Calculate line direction and perpendicular
@@ -384,21 +294,20 @@ def _render_hatch_layer_with_threshold(
     current_offset = -diagonal / 2
     max_offset = diagonal / 2
 
-    # Use cross-hatch config parameters
-    line_spacing_dark = processing_config.cross_hatch_line_spacing_dark
-    line_spacing_light = processing_config.cross_hatch_line_spacing_light
-    segment_max_length = processing_config.cross_hatch_segment_max_length
-    segment_min_length = processing_config.cross_hatch_segment_min_length
-    segment_gap = processing_config.cross_hatch_segment_gap
+    # Loop-invariant ranges for the darkness-based spacing and segment lengths
+    spacing_range = line_spacing_light - line_spacing_dark
+    segment_range = segment_max_length - segment_min_length
 
     while current_offset < max_offset:
         # Find line intersection with image bounds
+        # Line passes through point: (width/2 + current_offset * px, height/2 + current_offset * py)
         center_x = width / 2 + current_offset * px
         center_y = height / 2 + current_offset * py
 
         line_points = clip_line_to_rect(center_x, center_y, dx, dy, 0, 0, width, height)
 
         if not line_points or len(line_points) != 2:
+            # Line doesn't intersect image, skip to next
             current_offset += line_spacing_light
             continue
 
@@ -413,17 +322,17 @@ def _render_hatch_layer_with_threshold(
         dir_x = (x2 - x1) / line_length
         dir_y = (y2 - y1) / line_length
 
-        # Sample brightness at multiple points to determine spacing
-        num_samples = 10
-        total_brightness = 0.0
-        for i in range(num_samples):
-            t = i / (num_samples - 1) if num_samples > 1 else 0.5
-            sample_x = int(x1 + t * (x2 - x1))
-            sample_y = int(y1 + t * (y2 - y1))
-            total_brightness += get_brightness(image, sample_x, sample_y)
-
-        avg_brightness = total_brightness / num_samples
-        avg_darkness = 1.0 - avg_brightness
+        # AIDEV-NOTE: Average brightness over every pixel the clipped line crosses
+        # (one sample per pixel step) instead of a handful of fixed samples, so
+        # thin dark features along the line still influence the spacing. The
+        # clipped endpoints can sit exactly on the far image edge; those samples
+        # belong to the border pixel.
+        num_samples = max(int(max(abs(x2 - x1), abs(y2 - y1))), 2)
+        t = np.linspace(0.0, 1.0, num_samples)
+        sample_x = np.clip((x1 + t * (x2 - x1)).astype(np.intp), 0, width - 1)
+        sample_y = np.clip((y1 + t * (y2 - y1)).astype(np.intp), 0, height - 1)
+        avg_brightness = float(luminance[sample_y, sample_x].mean())
+        avg_darkness = avg_brightness if invert else 1.0 - avg_brightness
 
         # Skip this line entirely if average darkness below threshold
         if avg_darkness < darkness_threshold:
@@ -431,9 +340,11 @@ def _render_hatch_layer_with_threshold(
             continue
 
         # Calculate spacing to next parallel line based on darkness
-        spacing = line_spacing_light - avg_darkness * (line_spacing_light - line_spacing_dark)
+        spacing = line_spacing_light - avg_darkness * spacing_range
 
-        # Break line into segments with varying lengths
+        # AIDEV-NOTE: Break line into segments with varying lengths based on local brightness
+        # Darker areas get longer segments, lighter areas get shorter segments.
+        # Each segment start depends on the previous length, so this walk stays sequential.
         current_distance = 0.0
 
         while current_distance < line_length:
@@ -441,11 +352,9 @@ def _render_hatch_layer_with_threshold(
             seg_start_x = x1 + current_distance * dir_x
             seg_start_y = y1 + current_distance * dir_y
 
-            # Sample brightness at segment start
-            sample_x = int(seg_start_x)
-            sample_y = int(seg_start_y)
-            brightness = get_brightness(image, sample_x, sample_y)
-            darkness = 1.0 - brightness
+            # Sample brightness at segment start to determine segment length
+            brightness = get_brightness(luminance, int(seg_start_x), int(seg_start_y))
+            darkness = brightness if invert else 1.0 - brightness
 
             # Skip segments below threshold
             if darkness < darkness_threshold:
@@ -453,9 +362,8 @@ def _render_hatch_layer_with_threshold(
                 continue
 
             # Calculate segment length based on darkness
-            segment_length = segment_min_length + darkness * (
-                segment_max_length - segment_min_length
-            )
+            # Darker = longer segments (up to max), lighter = shorter segments (down to min)
+            segment_length = segment_min_length + darkness * segment_range
 
             # Clamp to remaining line length
             segment_length = min(segment_length, line_length - current_distance)
@@ -464,30 +372,38 @@ def _render_hatch_layer_with_threshold(
             seg_end_x = seg_start_x + segment_length * dir_x
             seg_end_y = seg_start_y + segment_length * dir_y
 
-            # Sample color at segment midpoint
-            mid_seg_x = int((seg_start_x + seg_end_x) / 2)
-            mid_seg_y = int((seg_start_y + seg_end_y) / 2)
-            segment_color = get_color(image, mid_seg_x, mid_seg_y)
+            segments.append((seg_start_x, seg_start_y, seg_end_x, seg_end_y))
 
-            # Convert to machine coordinates and add segment
-            machine_points = [
-                (seg_start_x + offset_x, seg_start_y + offset_y),
-                (seg_end_x + offset_x, seg_end_y + offset_y),
-            ]
-            paths.append(
-                ColoredPath(
-                    points=machine_points,
-                    color=segment_color,
-                    is_closed=False,
-                )
-            )
-
-            # Move to next segment position
+            # Move to next segment position (segment length + gap)
             current_distance += segment_length + segment_gap
 
         current_offset += spacing
 
-    return paths
+    if not segments:
+        return []
+
+    segment_array = np.array(segments)
+
+    # Sample every segment's color at its midpoint in one gather; midpoints
+    # outside the image count as white
+    mid_x = ((segment_array[:, 0] + segment_array[:, 2]) / 2).astype(np.intp)
+    mid_y = ((segment_array[:, 1] + segment_array[:, 3]) / 2).astype(np.intp)
+    in_bounds = (mid_x >= 0) & (mid_x < width) & (mid_y >= 0) & (mid_y < height)
+    colors = np.where(
+        in_bounds[:, None],
+        rgb[np.clip(mid_y, 0, height - 1), np.clip(mid_x, 0, width - 1)],
+        255,
+    )
+    segment_colors = map(tuple, colors.tolist())
+
+    # Convert every segment to machine coordinates in one pass; each path's
+    # points are a (2, 2) view into the shared array
+    machine_points = segment_array.reshape(-1, 2, 2)
+    machine_points += (offset_x, offset_y)
+    return [
+        ColoredPath(points=points, color=color, is_closed=False)
+        for points, color in zip(machine_points, segment_colors)
+    ]
 
 
 """TODO
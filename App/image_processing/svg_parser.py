@@ -1,11 +1,24 @@
 """SVG parsing and path extraction functionality."""
 
-from itertools import chain
+import functools
+import io
 
-import svg
+import numpy as np
 
 from models import ColoredPath
 
+# AIDEV-NOTE: The SVG is written as text directly rather than through an svg.py
+# element tree - building and stringifying one element object per stipple was
+# the slowest part of processing. Output matches what svg.py produced.
+_SVG_OPEN = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="{} {} {} {}"'
+
+
+@functools.lru_cache(maxsize=1024)
+def _rgb(color: "tuple[int, int, int]") -> str:
+    """Format an RGB tuple as an SVG color, once per distinct color."""
+    r, g, b = color
+    return f"rgb({r},{g},{b})"
+
 
 def colored_paths_to_svg(
     colored_paths: list[ColoredPath],
@@ -20,15 +33,12 @@ def colored_paths_to_svg(
     """
     if not colored_paths:
         # Return empty SVG if no paths
-        return svg.SVG(viewBox=svg.ViewBoxSpec(0, 0, 100, 100), elements=[]).as_str()
-
-    elements: list[svg.Element] = []
+        return _SVG_OPEN.format(0, 0, 100, 100) + "/>"
 
-    # Calculate bounding box from all coordinates
-    min_x = float("inf")
-    max_x = float("-inf")
-    min_y = float("inf")
-    max_y = float("-inf")
+    body = io.StringIO()
+    write = body.write
+    drawn_points: list[np.ndarray] = []
+    has_elements = False
 
     for path in colored_paths:
         r, g, b = path.color
@@ -38,28 +48,29 @@ def colored_paths_to_svg(
         if r < threshold and g < threshold and b < threshold:
             continue
 
-        points = list(path.points)
-        if path.is_closed and points:
-            points.append(points[0])  # Close the path
-
-        # Flatten points for SVG Polyline
-        # Cast to list to satisfy type checker (svg library uses list[Number])
-        path_points: list[float] = list(chain.from_iterable(points))
-
-        svg_element = svg.Polyline(
-            points=path_points,  # type: ignore[arg-type]
-            stroke=f"rgb({r},{g},{b})",
-            fill="none" if not path.is_closed else f"rgb({r},{g},{b})",
-            stroke_width=1,
-        )
-        elements.append(svg_element)
-
-        # Update bounding box for all points
-        for x, y in points:
-            min_x = min(min_x, x)
-            max_x = max(max_x, x)
-            min_y = min(min_y, y)
-            max_y = max(max_y, y)
+        points = path.points
+        if path.is_closed and len(points):
+            points = np.vstack((points, points[:1]))  # Close the path
+
+        # Flatten points for SVG Polyline ("x1 y1 x2 y2 ...")
+        path_points = " ".join(map(str, points.ravel().tolist()))
+
+        color = _rgb(path.color)
+        fill = color if path.is_closed else "none"
+        write(f'<polyline stroke="{color}" stroke-width="1" points="{path_points}" fill="{fill}"/>')
+        has_elements = True
+        # Empty paths are still written but have no extent
+        if len(points):
+            drawn_points.append(points)
+
+    # Calculate bounding box from all drawn coordinates
+    if drawn_points:
+        all_points = np.concatenate(drawn_points)
+        min_x, min_y = all_points.min(axis=0).tolist()
+        max_x, max_y = all_points.max(axis=0).tolist()
+    else:
+        min_x = min_y = float("inf")
+        max_x = max_y = float("-inf")
 
     # Add small padding to prevent edge clipping
     padding = 5
@@ -68,8 +79,7 @@ def colored_paths_to_svg(
     viewbox_width = (max_x - min_x) + (2 * padding)
     viewbox_height = (max_y - min_y) + (2 * padding)
 
-    final_svg = svg.SVG(
-        viewBox=svg.ViewBoxSpec(viewbox_x, viewbox_y, viewbox_width, viewbox_height),
-        elements=elements,
-    )
-    return final_svg.as_str()
+    header = _SVG_OPEN.format(viewbox_x, viewbox_y, viewbox_width, viewbox_height)
+    if not has_elements:
+        return header + "/>"
+    return f"{header}>{body.getvalue()}</svg>"
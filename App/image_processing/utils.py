@@ -4,9 +4,9 @@ AIDEV-NOTE: This module contains helper functions for scaling, color operations,
 and path calculations used throughout the image processing pipeline.
 """
 
-import math
 from typing import TYPE_CHECKING
 
+import numpy as np
 from PIL import Image
 
 if TYPE_CHECKING:
@@ -50,23 +50,30 @@ def scale_paths_to_machine(
     offset_x = margin + (safe_width - scaled_width) / 2
     offset_y = margin + (safe_height - scaled_height) / 2
 
-    # Scale all paths
-    scaled_paths = []
-    for path in paths:
-        scaled_points = [(x * scale + offset_x, y * scale + offset_y) for x, y in path.points]
-        scaled_paths.append(
-            ColoredPath(
-                points=scaled_points,
-                color=path.color,
-                is_closed=path.is_closed,
-            )
+    if not paths:
+        return [], scale, offset_x, offset_y
+
+    # Scale all points in one pass, then hand each path a view of its rows
+    all_points = np.concatenate([path.points for path in paths])
+    all_points *= scale
+    all_points += (offset_x, offset_y)
+    path_ends = np.cumsum([len(path.points) for path in paths])[:-1]
+
+    scaled_paths = [
+        ColoredPath(
+            points=scaled_points,
+            color=path.color,
+            is_closed=path.is_closed,
         )
+        for path, scaled_points in zip(paths, np.split(all_points, path_ends))
+    ]
 
     return scaled_paths, scale, offset_x, offset_y
 
 
 def scale_image_to_machine(
-    image: Image.Image, machine_config: "MachineConfig"
+    image: Image.Image,
+    machine_config: "MachineConfig",
 ) -> "tuple[Image.Image, float, float, float]":
     """Scale image to fit within machine bounds while maintaining aspect ratio.
 
@@ -76,10 +83,16 @@ def scale_image_to_machine(
 
     Returns:
         Tuple of (scaled_image, scale_factor, offset_x, offset_y)
-        where offsets are in mm for centering in machine space
+        where scaled_image is in RGB mode and offsets are in mm for
+        centering in machine space
 
     AIDEV-NOTE: This scales the image so that when we sample pixels,
-    pixel coordinates map directly to mm in machine space.
+    pixel coordinates map directly to mm in machine space. Bilinear is used
+    since the renderers only sample brightness/color on a coarse
+    grid and gain nothing from Lanczos' sharper (and slower) kernel. The
+    RGB conversion happens after the resize on purpose: Pillow premultiplies
+    alpha when resizing RGBA, so fully transparent pixels come out black rather
+    than exposing whatever color is hidden under them.
     """
     margin = machine_config.safe_margin
     safe_width = machine_config.width - 2 * margin
@@ -101,7 +114,9 @@ def scale_image_to_machine(
     new_height = int(orig_height * scale)
 
     # Resize image
-    scaled_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    scaled_image = image.resize((new_width, new_height), Image.Resampling.BILINEAR)
+    if scaled_image.mode != "RGB":
+        scaled_image = scaled_image.convert("RGB")
 
     # Calculate centering offsets in mm
     offset_x = margin + (safe_width - new_width) / 2
@@ -112,13 +127,20 @@ def scale_image_to_machine(
 
 def calculate_total_length(paths: "list[ColoredPath]") -> float:
     """Calculate total path length in mm."""
-    total = 0.0
-    for path in paths:
-        for i in range(1, len(path.points)):
-            x1, y1 = path.points[i - 1]
-            x2, y2 = path.points[i]
-            total += math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-    return total
+    if not paths:
+        return 0.0
+
+    # AIDEV-NOTE: Measure every segment of every path in one NumPy pass over the
+    # concatenated points, then drop the bogus "segments" joining consecutive paths.
+    points = np.concatenate([path.points for path in paths])
+    if len(points) < 2:
+        return 0.0
+
+    segment_lengths = np.hypot(*np.diff(points, axis=0).T)
+    path_ends = np.cumsum([len(path.points) for path in paths])
+    path_ends = path_ends[(path_ends > 0) & (path_ends < len(points))]
+    segment_lengths[path_ends - 1] = 0.0
+    return float(segment_lengths.sum())
 
 
 def count_commands(paths: "list[ColoredPath]") -> int:
@@ -126,113 +148,95 @@ def count_commands(paths: "list[ColoredPath]") -> int:
     return sum(len(path.points) for path in paths)
 
 
-def get_brightness(image: Image.Image, x: int, y: int) -> float:
-    """Get brightness (0-1) at a pixel location.
+def image_to_arrays(image: Image.Image) -> "tuple[np.ndarray, np.ndarray]":
+    """Convert an image to arrays for fast per-pixel lookups.
 
     Args:
-        image: Grayscale PIL image
-        x: X coordinate
-        y: Y coordinate
+        image: PIL image in any mode (alpha is dropped)
 
     Returns:
-        Brightness value from 0 (black) to 1 (white)
+        Tuple of (rgb, luminance) where rgb is a HxWx3 uint8 array and
+        luminance is a HxW float array with brightness from 0 (black) to 1 (white)
+
+    AIDEV-NOTE: Renderers convert once and index these arrays instead of
+    calling Image.getpixel per sample. Luminance uses the same Rec. 601
+    weights (and evaluation order) as the old per-pixel code.
     """
-    width, height = image.size
-    if 0 <= x < width and 0 <= y < height:
-        pixel = image.getpixel((x, y))
-        if isinstance(pixel, tuple):
-            # RGB image, convert to brightness
-            r, g, b = pixel[:3]
-            brightness = (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
-            return brightness
-        elif isinstance(pixel, int) or isinstance(pixel, float):
-            # Grayscale pixel
-            return pixel / 255.0
-    return 1.0  # Default to white (no drawing) for out of bounds
+    rgb = np.asarray(image if image.mode == "RGB" else image.convert("RGB"))
+    r, g, b = (rgb[..., i].astype(np.float64) for i in range(3))
+    luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255.0
+    return rgb, luminance
 
 
-def get_color(image: Image.Image, x: int, y: int) -> "tuple[int, int, int]":
-    """Get RGB color at a pixel location.
+def get_brightness(luminance: np.ndarray, x: int, y: int) -> float:
+    """Get brightness (0-1) at a pixel location.
 
     Args:
-        image: RGB PIL image
+        luminance: Luminance array from image_to_arrays()
         x: X coordinate
         y: Y coordinate
 
     Returns:
-        RGB tuple (0-255 each channel)
-
-    AIDEV-NOTE: Used for sampling quantized colors to assign to paths.
-    Returns white for out-of-bounds pixels.
+        Brightness value from 0 (black) to 1 (white)
     """
-    width, height = image.size
+    height, width = luminance.shape
     if 0 <= x < width and 0 <= y < height:
-        pixel = image.getpixel((x, y))
-        if isinstance(pixel, tuple):
-            r, g, b = pixel[:3]
-            return (int(r), int(g), int(b))  # RGB only (drop alpha if present)
-        else:
-            # Grayscale pixel, convert to RGB tuple
-            gray_int = int(pixel) if pixel is not None else 255
-            return (gray_int, gray_int, gray_int)
-    return (255, 255, 255)  # Default to white for out of bounds
-
-
-def get_average_color_circle(
-    image: Image.Image,
-    center_x: int,
-    center_y: int,
-    radius: int,
-) -> "tuple[int, int, int]":
-    """Get average RGB color within a circular area.
+        return float(luminance[y, x])
+    return 1.0  # Default to white (no drawing) for out of bounds
+
+
+def average_colors_in_circles(
+    rgb: np.ndarray,
+    centers_x: np.ndarray,
+    centers_y: np.ndarray,
+    radii: np.ndarray,
+) -> np.ndarray:
+    """Get average RGB colors within many circular areas at once.
 
     Args:
-        image: RGB PIL image
-        center_x: Center X coordinate
-        center_y: Center Y coordinate
-        radius: Radius of circle
+        rgb: RGB array from image_to_arrays()
+        centers_x: Integer center X coordinates
+        centers_y: Integer center Y coordinates
+        radii: Integer radii, one per circle
 
     Returns:
-        Average RGB color tuple (0-255 each channel)
+        (N, 3) int64 array of average colors (white where a circle covers no pixels)
 
-    AIDEV-NOTE: Samples pixels within the circle to compute average.
+    AIDEV-NOTE: A circle covers every pixel with dx^2 + dy^2 <= r^2, clipped to
+    the image, and its color is the integer mean of those pixels. Uses per-row
+    prefix sums: a disk is a stack of horizontal pixel runs, so its total is the
+    sum over its rows of prefix[end] - prefix[start]. That is O(radius) lookups
+    per circle, vectorized across all circles, and exact.
     """
-    width, height = image.size
-    r_squared = radius * radius
-    total_r = total_g = total_b = count = 0
-
-    for y in range(center_y - radius, center_y + radius + 1):
-        for x in range(center_x - radius, center_x + radius + 1):
-            if 0 <= x < width and 0 <= y < height:
-                dx = x - center_x
-                dy = y - center_y
-                if dx * dx + dy * dy <= r_squared:
-                    pixel = image.getpixel((x, y))
-                    if isinstance(pixel, tuple):
-                        r, g, b = pixel[:3]
-                    else:
-                        r = g = b = pixel
-
-                    if r is None or g is None or b is None:
-                        continue
-
-                    r = int(r)
-                    g = int(g)
-                    b = int(b)
-
-                    total_r += r
-                    total_g += g
-                    total_b += b
-                    count += 1
-
-    if count == 0:
-        return (255, 255, 255)  # Default to white
-
-    return (
-        total_r // count,
-        total_g // count,
-        total_b // count,
-    )
+    height, width = rgb.shape[:2]
+    centers_x = np.asarray(centers_x, dtype=np.int64)
+    centers_y = np.asarray(centers_y, dtype=np.int64)
+    radii = np.asarray(radii, dtype=np.int64)
+
+    # row_sums[y, x] = sum of rgb[y, :x]
+    row_sums = np.zeros((height, width + 1, 3), dtype=np.int64)
+    np.cumsum(rgb, axis=1, out=row_sums[:, 1:])
+
+    totals = np.zeros((len(radii), 3), dtype=np.int64)
+    counts = np.zeros(len(radii), dtype=np.int64)
+    max_radius = int(radii.max()) if len(radii) else -1
+
+    for dy in range(-max_radius, max_radius + 1):
+        # Half-width of this row of the disk: largest dx with dx^2 + dy^2 <= r^2
+        remaining = radii * radii - dy * dy
+        half_width = np.sqrt(np.maximum(remaining, 0)).astype(np.int64)
+        y = centers_y + dy
+        x0 = np.maximum(centers_x - half_width, 0)
+        x1 = np.minimum(centers_x + half_width + 1, width)
+
+        idx = np.nonzero((remaining >= 0) & (y >= 0) & (y < height) & (x0 < x1))[0]
+        totals[idx] += row_sums[y[idx], x1[idx]] - row_sums[y[idx], x0[idx]]
+        counts[idx] += x1[idx] - x0[idx]
+
+    colors = np.full((len(radii), 3), 255, dtype=np.int64)  # Default to white
+    covered = counts > 0
+    colors[covered] = totals[covered] // counts[covered, None]
+    return colors
 
 
 def clip_line_to_rect(
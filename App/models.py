@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+import numpy as np
+
 __all__ = [
     "MACHINE_WIDTH",
     "MACHINE_HEIGHT",
@@ -93,18 +95,31 @@ class PlotterState:
 # --- Image Processing Models ---
 
 
-@dataclass
+@dataclass(eq=False)
 class ColoredPath:
     """A vectorized path with associated color.
 
     AIDEV-NOTE: Represents a single path segment from image vectorization.
     Points are in mm coordinates (machine space). Color is RGB (0-255).
+    Points are stored as one (N, 2) float64 array so downstream scaling,
+    length and SVG code can work on whole paths with NumPy. Sequences of
+    (x, y) pairs are accepted and converted; any other shape raises
+    ValueError. Paths compare by identity.
     """
 
-    points: "list[tuple[float, float]]"  # (x, y) coordinates in mm
+    points: np.ndarray  # (N, 2) array of (x, y) coordinates in mm
     color: "tuple[int, int, int]"  # RGB color (0-255)
     is_closed: bool = False  # Whether path forms a closed loop
 
+    def __post_init__(self):
+        points = np.asarray(self.points, dtype=np.float64)
+        if points.size == 0:
+            # An empty sequence has no shape to check; normalize it to (0, 2)
+            points = points.reshape(0, 2)
+        elif points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError(f"ColoredPath points must have shape (N, 2), got {points.shape}")
+        self.points = points
+
 
 @dataclass
 class ImageProcessingConfig:
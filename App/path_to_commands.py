@@ -37,7 +37,7 @@ class PathToCommandsConverter:
         commands = []
         r, g, b = path.color
 
-        for x, y in path.points:
+        for x, y in path.points.tolist():
             if include_color:
                 cmd = f"M {x:.1f} {y:.1f} {r} {g} {b}"
             else:
@@ -84,13 +84,10 @@ class PathToCommandsConverter:
             # For stipples, we only want to move to the
             # center of each path (circle)
             for path in paths:
-                if not path.points:
+                if len(path.points) == 0:
                     continue
                 # Calculate center point
-                xs = [p[0] for p in path.points]
-                ys = [p[1] for p in path.points]
-                center_x = sum(xs) / len(xs)
-                center_y = sum(ys) / len(ys)
+                center_x, center_y = path.points.mean(axis=0).tolist()
 
                 r, g, b = path.color
 
@@ -260,10 +257,10 @@ class PathToCommandsConverter:
         best_start_dist = float("inf")
 
         for path in remaining:
-            if not path.points:
+            if len(path.points) == 0:
                 continue
-            dist_to_start = np.linalg.norm(np.array(path.points[0]) - machine_center)
-            dist_to_end = np.linalg.norm(np.array(path.points[-1]) - machine_center)
+            dist_to_start = np.linalg.norm(path.points[0] - machine_center)
+            dist_to_end = np.linalg.norm(path.points[-1] - machine_center)
 
             # Check if starting from this path (normal or reversed) is better
             if dist_to_start < best_start_dist:
@@ -279,7 +276,7 @@ class PathToCommandsConverter:
 
         # Greedy nearest-neighbor with path reversal
         while remaining:
-            current_end = np.array(current.points[-1])
+            current_end = current.points[-1]
 
             best_candidate = None
             best_distance = float("inf")
@@ -287,11 +284,11 @@ class PathToCommandsConverter:
 
             # Evaluate all remaining paths in both orientations
             for candidate in remaining:
-                if not candidate.points:
+                if len(candidate.points) == 0:
                     continue
 
-                candidate_start = np.array(candidate.points[0])
-                candidate_end = np.array(candidate.points[-1])
+                candidate_start = candidate.points[0]
+                candidate_end = candidate.points[-1]
 
                 # Distance if we connect to the start (normal orientation)
                 dist_to_start = np.linalg.norm(candidate_start - current_end)
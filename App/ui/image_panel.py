@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
@@ -37,6 +38,8 @@ from ui.components import (
 from ui.styles import image_preview_stylesheet
 from ui.widgets import CollapsibleGroupBox
 
+log = logging.getLogger(__name__)
+
 
 class ProcessingThread(QThread):
     """Background thread for image processing to avoid blocking UI."""
@@ -444,10 +447,11 @@ class ImagePanel(QGroupBox):
             add_home_end=True,
         )
 
-        # Save commands to file (for debugging)
-        with open("debug_commands.txt", "w") as f:
-            for cmd in commands:
-                f.write(cmd + "\n")
+        # Save commands to file (for debugging) in a single write; opt in by
+        # enabling debug logging for this module
+        if log.isEnabledFor(logging.DEBUG):
+            with open("debug_commands.txt", "w") as f:
+                f.write("\n".join(commands) + "\n")
 
         # Validate commands
         valid, errors = converter.validate_commands(commands)
@@ -1,11 +1,10 @@
 """Main application window for plotter control."""
 
-import os
 from typing import Optional
 
 import serial.tools.list_ports  # Import for port listing
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QComboBox,
     QDockWidget,
@@ -20,6 +19,7 @@ from PyQt6.QtWidgets import (
 from config_manager import ConfigManager
 from models import (
     ConnectionState,
+    MachineConfig,
     PlotterState,
     ProcessedImage,
 )
@@ -43,11 +43,11 @@ class PlotterControlWindow(QMainWindow):
         self.setWindowTitle("PolarPlot Controller v0.1.0")
         self.setMinimumSize(1000, 800)
 
-        self.setWindowIcon(QIcon(os.path.join("assets", "app_icon.icns")))
+        # Window icon is set application-wide in app.main()
 
         # Application state
         self.config_manager = ConfigManager()
-        self.machine_config = self.config_manager.load()
+        self.machine_config: MachineConfig  # Loaded in _deferred_init
         self.plotter_state = PlotterState()
         self.serial_thread: Optional[SerialThread] = None
 
@@ -61,9 +61,23 @@ class PlotterControlWindow(QMainWindow):
         self.image_panel: ImagePanel
         self.simulation_ui: SimulationUI
 
+        # AIDEV-NOTE: Only a placeholder is built here so the window can be shown
+        # immediately; config load and the full widget tree are created on the
+        # first event loop iteration in _deferred_init.
+        self._initialized = False
+        placeholder = QLabel("Loading...")
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setCentralWidget(placeholder)
+        QTimer.singleShot(0, self._deferred_init)
+
+    def _deferred_init(self):
+        """Load configuration and build the full UI once the window is visible."""
+        self.machine_config = self.config_manager.load()
+
         self._setup_ui()
         self._connect_signals()
         self._update_connection_state()
+        self._initialized = True
 
     def _setup_ui(self):
         """Initialize the user interface."""
@@ -652,6 +666,7 @@ class PlotterControlWindow(QMainWindow):
 
     def closeEvent(self, a0):
         """Clean up when window closes."""
-        self._disconnect()
+        if self._initialized:
+            self._disconnect()
         if a0:
             a0.accept()
@@ -1,5 +1,6 @@
 """Simulation of the machine's state and future behavior."""
 
+import logging
 import math
 from typing import List, Tuple
 
@@ -11,6 +12,8 @@ from PyQt6.QtWidgets import QCheckBox, QSlider
 from models import ColoredPath, MachineConfig, PlotterState
 from ui.styles import ThemeColors
 
+log = logging.getLogger(__name__)
+
 
 class SimulationCanvas(QtWidgets.QWidget):
     """Custom widget for rendering the plotter simulation."""
@@ -208,14 +211,12 @@ class SimulationCanvas(QtWidgets.QWidget):
                 r, g, b = colored_path.color
                 painter.setPen(QPen(QColor(r, g, b), 1.5))
 
+                points = colored_path.points.tolist()
                 path = QPainterPath()
-                first_point = self._world_to_screen(
-                    colored_path.points[0][0],
-                    colored_path.points[0][1],
-                )
+                first_point = self._world_to_screen(points[0][0], points[0][1])
                 path.moveTo(QPointF(first_point[0], first_point[1]))
 
-                for x, y in colored_path.points[1:]:
+                for x, y in points[1:]:
                     screen_pos = self._world_to_screen(x, y)
                     path.lineTo(QPointF(screen_pos[0], screen_pos[1]))
 
@@ -390,7 +391,7 @@ class SimulationUI(QtWidgets.QWidget):
 
             # Stop queue execution
             if self.queue_execution_active:
-                print("Queue execution paused.")
+                log.info("Queue execution paused")
                 self.queue_execution_active = False
 
     def reset_simulation(self):
@@ -530,16 +531,13 @@ class SimulationUI(QtWidgets.QWidget):
         processed one at a time; the animation timer waits for gondola to
         reach each target before moving to the next command.
         """
-        print("Executing command queue...")
         if self.command_queue is None:
-            print("Command queue not set.")
+            log.warning("Command queue not set")
             return
 
         all_commands = self.command_queue.get_all_commands()
-        print(f"Commands in queue: {len(all_commands)} commands")
-
         if not all_commands:
-            print("Queue is empty.")
+            log.info("Command queue is empty")
             return
 
         # Initialize queue processing
@@ -547,7 +545,7 @@ class SimulationUI(QtWidgets.QWidget):
         self.current_queue_index = 0
         self.queue_execution_active = True
 
-        print("Starting sequential command queue execution...")
+        log.info("Executing %d queued commands", len(all_commands))
         # Process first command immediately
         self._process_next_queued_command()
 
@@ -563,7 +561,7 @@ class SimulationUI(QtWidgets.QWidget):
 
         if self.current_queue_index >= len(self.queued_commands):
             # Queue execution complete
-            print("Command queue execution complete.")
+            log.info("Command queue execution complete")
             self.queue_execution_active = False
             self.current_queue_index = 0
             self.queued_commands = []
@@ -571,9 +569,11 @@ class SimulationUI(QtWidgets.QWidget):
 
         # Execute current command
         command = self.queued_commands[self.current_queue_index]
-        print(
-            f"Processing command {self.current_queue_index + 1}/"
-            f"{len(self.queued_commands)}: {command}"
+        log.debug(
+            "Processing command %d/%d: %s",
+            self.current_queue_index + 1,
+            len(self.queued_commands),
+            command,
         )
         self._execute_command(command)
 
@@ -601,32 +601,34 @@ class SimulationUI(QtWidgets.QWidget):
                         r = int(parts[3])
                         g = int(parts[4])
                         b = int(parts[5])
-                        print(f"Simulating move to ({x}, {y}) with LED color ({r}, {g}, {b})")
+                        log.debug(
+                            "Simulating move to (%s, %s) with LED color (%d, %d, %d)", x, y, r, g, b
+                        )
                         self.canvas.set_led_color(r, g, b)
                     else:
-                        print(f"Simulating move to ({x}, {y})")
+                        log.debug("Simulating move to (%s, %s)", x, y)
 
                     self.move_to(x, y)
                 except (ValueError, IndexError) as e:
-                    print(f"Invalid move command: {command} - {e}")
+                    log.warning("Invalid move command: %s - %s", command, e)
         elif command.startswith("H"):
             # Home command
-            print("Simulating home command")
+            log.debug("Simulating home command")
             self._move_to_home()
         elif command.startswith("T"):
             # Test pattern command - execute test square
-            print("Simulating test pattern (square)")
+            log.debug("Simulating test pattern (square)")
             # Test pattern moves to corners in sequence
             # This will be handled by queuing multiple moves
             pass
         elif command.startswith("C"):
             # Calibration command - not applicable to simulation
-            print("Calibration command ignored in simulation")
+            log.debug("Calibration command ignored in simulation")
         elif command.startswith("?"):
             # Status query - not applicable to simulation
-            print("Status query ignored in simulation")
+            log.debug("Status query ignored in simulation")
         else:
-            print(f"Unknown command in simulation: {command}")
+            log.warning("Unknown command in simulation: %s", command)
 
     # === Preview Path Methods ===
 